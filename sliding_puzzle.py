@@ -4,11 +4,12 @@ Sliding Tile Puzzle Game
 A beautiful and polished puzzle game using Python and Pygame.
 """
 
+import functools
+import numpy as np
 import pygame
 import random
 import sys
-import time
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 # Initialize Pygame
 pygame.init()
@@ -21,6 +22,12 @@ TILE_SIZE = 120
 GRID_MARGIN = 10
 ANIMATION_SPEED = 15  # Higher = faster animation
 
+# Grid offsets of the four neighbours of a cell
+_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+# Events whose visible effects are tracked by dirty rects rather than a full redraw
+_INPUT_EVENTS = frozenset((pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+
 # Colors
 BG_COLOR = (240, 248, 255)  # Alice blue
 GRID_BG_COLOR = (70, 130, 180)  # Steel blue
@@ -38,46 +45,71 @@ WIN_FONT = pygame.font.Font(None, 64)
 BUTTON_FONT = pygame.font.Font(None, 28)
 
 
-class Tile:
-    """Represents a single puzzle tile."""
-
-    def __init__(self, number: int, pos: Tuple[int, int], image_rect: pygame.Rect):
-        self.number = number  # 0 represents empty tile
-        self.grid_pos = list(pos)  # Current position in grid
-        self.target_pos = list(pos)  # Target position for animation
-        self.current_pixel_pos = [0, 0]  # Current pixel position for smooth animation
-        self.image_rect = image_rect  # The portion of the image this tile shows
-
-    def update_position(self, new_pos: Tuple[int, int]):
-        """Set a new target position for the tile to animate to."""
-        self.target_pos = list(new_pos)
-
-    def animate(self):
-        """Smoothly animate tile to target position."""
-        target_pixel_x = self.target_pos[0] * (TILE_SIZE + GRID_MARGIN)
-        target_pixel_y = self.target_pos[1] * (TILE_SIZE + GRID_MARGIN)
-
-        # Smooth animation
-        dx = target_pixel_x - self.current_pixel_pos[0]
-        dy = target_pixel_y - self.current_pixel_pos[1]
-
-        if abs(dx) > 1:
-            self.current_pixel_pos[0] += dx / ANIMATION_SPEED
-        else:
-            self.current_pixel_pos[0] = target_pixel_x
-
-        if abs(dy) > 1:
-            self.current_pixel_pos[1] += dy / ANIMATION_SPEED
-        else:
-            self.current_pixel_pos[1] = target_pixel_y
-
-        # Update grid position when animation completes
-        if self.current_pixel_pos[0] == target_pixel_x and self.current_pixel_pos[1] == target_pixel_y:
-            self.grid_pos = list(self.target_pos)
-
-    def is_animating(self) -> bool:
-        """Check if tile is currently animating."""
-        return self.grid_pos != self.target_pos
+def _fill_gradient(pixels: np.ndarray, center_x: int, center_y: int, max_distance: float):
+    """Write a radial blue-to-purple gradient into a preallocated (W, H, 3) array."""
+    width, height = pixels.shape[:2]
+
+    # Create a radial gradient effect; the open grids broadcast to (W, H)
+    x, y = np.ogrid[:width, :height]
+    ratio = np.hypot(x - center_x, y - center_y) / max_distance
+
+    # Color gradient from blue to purple, truncated into each uint8 channel
+    pixels[..., 0] = 100 + 120 * ratio
+    pixels[..., 1] = 50 + 100 * (1 - ratio)
+    pixels[..., 2] = 200 - 50 * ratio
+
+
+@functools.lru_cache(maxsize=4)
+def _neighbour_table(grid_size: int) -> Tuple[Tuple[int, ...], ...]:
+    """Board indices adjacent to each cell of a grid_size x grid_size board."""
+    return tuple(
+        tuple((y + dy) * grid_size + (x + dx) for dx, dy in _DIRECTIONS
+              if 0 <= x + dx < grid_size and 0 <= y + dy < grid_size)
+        for y in range(grid_size)
+        for x in range(grid_size)
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def load_puzzle_image(grid_size: int) -> pygame.Surface:
+    """Load or create a beautiful puzzle image.
+
+    The image depends only on the grid size, so it is built once per size
+    and shared by every game that uses it. The display mode must already be
+    set, since the image is converted to its pixel format.
+    """
+    # Create a beautiful gradient image with geometric patterns
+    size = TILE_SIZE * grid_size
+    image = pygame.Surface((size, size))
+
+    # Create a beautiful gradient background
+    # surfarray indexes pixels as [x][y], so fill the array in that layout
+    pixels = np.empty((size, size, 3), dtype=np.uint8)
+    center = size // 2
+    _fill_gradient(pixels, center, center, (center ** 2 + center ** 2) ** 0.5)
+    pygame.surfarray.blit_array(image, pixels)
+
+    # Add decorative circles
+    num_font = pygame.font.Font(None, 72)
+    for i in range(grid_size):
+        for j in range(grid_size):
+            center_x = i * TILE_SIZE + TILE_SIZE // 2
+            center_y = j * TILE_SIZE + TILE_SIZE // 2
+            radius = TILE_SIZE // 3
+
+            # Draw decorative circle
+            pygame.draw.circle(image, (255, 255, 255, 30), (center_x, center_y), radius, 3)
+            pygame.draw.circle(image, (255, 255, 255, 50), (center_x, center_y), radius // 2)
+
+            # Draw tile number in the center for visual interest
+            number = i + j * grid_size + 1
+            if number < grid_size * grid_size:
+                num_surface = num_font.render(str(number), True, (255, 255, 255, 200))
+                num_rect = num_surface.get_rect(center=(center_x, center_y))
+                image.blit(num_surface, num_rect)
+
+    # Match the display's pixel format so later blits take SDL's fast path
+    return image.convert()
 
 
 class Button:
@@ -91,10 +123,30 @@ class Button:
         self.hover_color = hover_color
         self.is_hovered = False
 
+        # Edges for the hover test, which runs on every mouse motion event
+        self._l, self._t, self._r, self._b = rect.left, rect.top, rect.right, rect.bottom
+
+        # Pre-render both states, so drawing is a single blit
+        self._surf_idle = self.render(color)
+        self._surf_hover = self.render(hover_color)
+
+    def render(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render the button with the given fill color into its own Surface."""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = surface.get_rect()
+        pygame.draw.rect(surface, color, local_rect, border_radius=8)
+        pygame.draw.rect(surface, TILE_BORDER_COLOR, local_rect, 2, border_radius=8)
+
+        text_surface = BUTTON_FONT.render(self.text, True, BUTTON_TEXT_COLOR)
+        text_rect = text_surface.get_rect(center=local_rect.center)
+        surface.blit(text_surface, text_rect)
+        return surface
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events. Returns True if button was clicked."""
         if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
+            x, y = event.pos
+            self.is_hovered = self._l <= x < self._r and self._t <= y < self._b
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
                 return True
@@ -102,13 +154,7 @@ class Button:
 
     def draw(self, screen: pygame.Surface):
         """Draw the button."""
-        color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(screen, color, self.rect, border_radius=8)
-        pygame.draw.rect(screen, TILE_BORDER_COLOR, self.rect, 2, border_radius=8)
-
-        text_surface = BUTTON_FONT.render(self.text, True, BUTTON_TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        screen.blit(self._surf_hover if self.is_hovered else self._surf_idle, self.rect.topleft)
 
 
 class SlidingPuzzle:
@@ -122,22 +168,51 @@ class SlidingPuzzle:
         self.clock = pygame.time.Clock()
         self.running = True
 
-        # Game state
-        self.tiles: List[Tile] = []
-        self.empty_pos = [grid_size - 1, grid_size - 1]  # Position of empty tile
+        # Game state, stored as parallel arrays indexed by tile number (0 is the empty tile)
+        num_tiles = grid_size * grid_size
+        self.gx = np.zeros(num_tiles, dtype=np.int16)  # Current position in grid
+        self.gy = np.zeros(num_tiles, dtype=np.int16)
+        self.tx = np.zeros(num_tiles, dtype=np.int16)  # Target position for animation
+        self.ty = np.zeros(num_tiles, dtype=np.int16)
+        self.cpx = np.zeros(num_tiles, dtype=np.int16)  # Current pixel position for smooth animation
+        self.cpy = np.zeros(num_tiles, dtype=np.int16)
+
+        # Logical board: board[y * grid_size + x] is the number of the tile in that cell
+        self._solved_board = bytes((i + 1) % num_tiles for i in range(num_tiles))
+        self.board = bytearray(self._solved_board)
+        self.empty_x = self.empty_y = grid_size - 1  # Position of empty tile
         self.moves = 0
-        self.start_time = time.time()
+        self.start_ticks = pygame.time.get_ticks()
         self.game_won = False
         self.animating = False
 
+        # Redraw bookkeeping: only the parts of the screen that changed are repainted
+        self._full_redraw = True
+        self._dirty_rects: List[pygame.Rect] = []
+
         # Load and prepare puzzle image
-        self.puzzle_image = self.load_puzzle_image()
+        self.puzzle_image = load_puzzle_image(grid_size)
+        self.tile_surfaces = self.render_tile_surfaces()
 
         # UI elements
         grid_offset_x = (WINDOW_WIDTH - (TILE_SIZE * grid_size + GRID_MARGIN * (grid_size - 1))) // 2
         grid_offset_y = 120
         self.grid_offset = (grid_offset_x, grid_offset_y)
 
+        # The grid background never changes, so render its rounded rect once
+        grid_bg_size = TILE_SIZE * grid_size + GRID_MARGIN * (grid_size + 1)
+        self._grid_bg = pygame.Surface((grid_bg_size, grid_bg_size), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.rect(self._grid_bg, GRID_BG_COLOR, self._grid_bg.get_rect(), border_radius=10)
+
+        # Static text is rendered once; the win overlay is rendered when the game is won
+        self.title_surface = TITLE_FONT.render("Sliding Puzzle", True, TEXT_COLOR)
+        self.title_rect = self.title_surface.get_rect(centerx=WINDOW_WIDTH // 2, top=20)
+        self._win_overlay: Optional[pygame.Surface] = None
+        self._last_info_key: Optional[Tuple[int, int, int]] = None
+        self._info_surface: Optional[pygame.Surface] = None
+        self._info_rect: Optional[pygame.Rect] = None
+        self._info_band = pygame.Rect(0, 75, WINDOW_WIDTH, UI_FONT.get_linesize())
+
         self.reset_button = Button(
             pygame.Rect(WINDOW_WIDTH // 2 - 80, WINDOW_HEIGHT - 70, 160, 50),
             "New Game",
@@ -148,131 +223,78 @@ class SlidingPuzzle:
         # Initialize puzzle
         self.init_puzzle()
 
-    def load_puzzle_image(self) -> pygame.Surface:
-        """Load or create a beautiful puzzle image."""
-        # Create a beautiful gradient image with geometric patterns
-        image = pygame.Surface((TILE_SIZE * self.grid_size, TILE_SIZE * self.grid_size))
-
-        # Create a beautiful gradient background
-        for y in range(TILE_SIZE * self.grid_size):
-            for x in range(TILE_SIZE * self.grid_size):
-                # Create a radial gradient effect
-                center_x = TILE_SIZE * self.grid_size // 2
-                center_y = TILE_SIZE * self.grid_size // 2
-                distance = ((x - center_x) ** 2 + (y - center_y) ** 2) ** 0.5
-                max_distance = ((center_x) ** 2 + (center_y) ** 2) ** 0.5
-
-                # Color gradient from blue to purple
-                ratio = distance / max_distance
-                r = int(100 + 120 * ratio)
-                g = int(50 + 100 * (1 - ratio))
-                b = int(200 - 50 * ratio)
-
-                image.set_at((x, y), (r, g, b))
-
-        # Add decorative circles
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                center_x = i * TILE_SIZE + TILE_SIZE // 2
-                center_y = j * TILE_SIZE + TILE_SIZE // 2
-                radius = TILE_SIZE // 3
-
-                # Draw decorative circle
-                pygame.draw.circle(image, (255, 255, 255, 30), (center_x, center_y), radius, 3)
-                pygame.draw.circle(image, (255, 255, 255, 50), (center_x, center_y), radius // 2)
-
-                # Draw tile number in the center for visual interest
-                number = i + j * self.grid_size + 1
-                if number < self.grid_size * self.grid_size:
-                    num_font = pygame.font.Font(None, 72)
-                    num_surface = num_font.render(str(number), True, (255, 255, 255, 200))
-                    num_rect = num_surface.get_rect(center=(center_x, center_y))
-                    image.blit(num_surface, num_rect)
-
-        return image
+    def render_tile_surfaces(self) -> Dict[int, pygame.Surface]:
+        """Pre-render each numbered tile (image slice plus border) into its own Surface."""
+        tile_surfaces = {}
+        for number in range(1, self.grid_size * self.grid_size):
+            col = (number - 1) % self.grid_size
+            row = (number - 1) // self.grid_size
+            image_rect = pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
+            surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
+            surface.blit(self.puzzle_image, (0, 0), image_rect)
+            pygame.draw.rect(surface, TILE_BORDER_COLOR, surface.get_rect(), 3, border_radius=5)
+            tile_surfaces[number] = surface.convert()
+        return tile_surfaces
 
     def init_puzzle(self):
         """Initialize the puzzle with tiles in solved position, then shuffle."""
-        self.tiles = []
-
-        # Create tiles in solved position
-        for row in range(self.grid_size):
-            for col in range(self.grid_size):
-                tile_num = row * self.grid_size + col + 1
-
-                # Last tile is empty
-                if tile_num == self.grid_size * self.grid_size:
-                    tile_num = 0
-                    self.empty_pos = [col, row]
-
-                # Define the image portion for this tile
-                image_rect = pygame.Rect(
-                    col * TILE_SIZE,
-                    row * TILE_SIZE,
-                    TILE_SIZE,
-                    TILE_SIZE
-                )
-
-                tile = Tile(tile_num, (col, row), image_rect)
-                tile.current_pixel_pos = [col * (TILE_SIZE + GRID_MARGIN),
-                                         row * (TILE_SIZE + GRID_MARGIN)]
-                self.tiles.append(tile)
+        num_tiles = self.grid_size * self.grid_size
+
+        # Place tiles in solved position; tile n sits in cell n - 1 and the empty tile is last
+        cells = (np.arange(num_tiles, dtype=np.int16) - 1) % num_tiles
+        self.gx[:] = cells % self.grid_size
+        self.gy[:] = cells // self.grid_size
+        self.tx[:] = self.gx
+        self.ty[:] = self.gy
+        self.cpx[:] = self.gx * (TILE_SIZE + GRID_MARGIN)
+        self.cpy[:] = self.gy * (TILE_SIZE + GRID_MARGIN)
+
+        self.board[:] = self._solved_board
+        self.empty_x = self.empty_y = self.grid_size - 1
 
         # Shuffle the puzzle
         self.shuffle_puzzle()
 
-        # Reset game state
+        # Reset game state; tiles slide from the solved layout into their shuffled spots
         self.moves = 0
-        self.start_time = time.time()
+        self.start_ticks = pygame.time.get_ticks()
         self.game_won = False
+        self.animating = True
+        self._full_redraw = True
 
     def shuffle_puzzle(self, num_moves: int = 100):
         """Shuffle the puzzle using valid moves to ensure solvability."""
+        # Random walk of the empty space on the logical board only
+        board = self.board
+        neighbours = _neighbour_table(self.grid_size)
+        empty = self.empty_y * self.grid_size + self.empty_x
         for _ in range(num_moves):
-            # Get valid moves
-            valid_moves = self.get_valid_moves()
-            if valid_moves:
-                # Pick a random valid move
-                move_pos = random.choice(valid_moves)
-                # Swap without counting as a player move
-                self.swap_tiles(move_pos, count_move=False)
-
-    def get_valid_moves(self) -> List[Tuple[int, int]]:
-        """Get list of tiles that can be moved (adjacent to empty space)."""
-        valid_moves = []
-        empty_x, empty_y = self.empty_pos
-
-        # Check all four directions
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        for dx, dy in directions:
-            new_x, new_y = empty_x + dx, empty_y + dy
-            if 0 <= new_x < self.grid_size and 0 <= new_y < self.grid_size:
-                valid_moves.append((new_x, new_y))
-
-        return valid_moves
-
-    def get_tile_at_pos(self, pos: Tuple[int, int]) -> Optional[Tile]:
-        """Get the tile at a specific grid position."""
-        for tile in self.tiles:
-            if tile.grid_pos == list(pos):
-                return tile
-        return None
-
-    def swap_tiles(self, tile_pos: Tuple[int, int], count_move: bool = True):
-        """Swap a tile with the empty space."""
-        tile = self.get_tile_at_pos(tile_pos)
-        if tile and tile.number != 0:
-            # Update tile position
-            old_pos = tile.grid_pos.copy()
-            tile.update_position(tuple(self.empty_pos))
-
-            # Update empty tile position
-            empty_tile = self.get_tile_at_pos(tuple(self.empty_pos))
-            if empty_tile:
-                empty_tile.update_position(tuple(old_pos))
+            idx = random.choice(neighbours[empty])
+            board[empty], board[idx] = board[idx], 0
+            empty = idx
+        self.empty_y, self.empty_x = divmod(empty, self.grid_size)
+
+        # Point every tile's animation target at its shuffled cell in one pass
+        cells = np.argsort(np.frombuffer(board, dtype=np.uint8))
+        self.tx[:] = cells % self.grid_size
+        self.ty[:] = cells // self.grid_size
+
+    def swap_tiles(self, x: int, y: int, count_move: bool = True):
+        """Swap the tile at (x, y) with the empty space."""
+        idx = y * self.grid_size + x
+        number = self.board[idx]
+        if number != 0:
+            # Swap the tile and the empty space on the logical board
+            self.board[self.empty_y * self.grid_size + self.empty_x] = number
+            self.board[idx] = 0
+
+            # Update tile and empty tile target positions for animation
+            self.tx[number], self.ty[number] = self.empty_x, self.empty_y
+            self.tx[0], self.ty[0] = x, y
 
             # Update empty position
-            self.empty_pos = list(old_pos)
+            self.empty_x, self.empty_y = x, y
 
             # Count move if it's a player move
             if count_move:
@@ -288,11 +310,11 @@ class SlidingPuzzle:
         grid_x = (mouse_pos[0] - self.grid_offset[0]) // (TILE_SIZE + GRID_MARGIN)
         grid_y = (mouse_pos[1] - self.grid_offset[1]) // (TILE_SIZE + GRID_MARGIN)
 
-        # Check if click is within grid
-        if 0 <= grid_x < self.grid_size and 0 <= grid_y < self.grid_size:
-            # Check if clicked tile is adjacent to empty space
-            if (grid_x, grid_y) in self.get_valid_moves():
-                self.swap_tiles((grid_x, grid_y))
+        # Check if click is within grid and the clicked tile is adjacent to the empty space
+        empty_x, empty_y = self.empty_x, self.empty_y
+        if (0 <= grid_x < self.grid_size and 0 <= grid_y < self.grid_size
+                and abs(grid_x - empty_x) + abs(grid_y - empty_y) == 1):
+            self.swap_tiles(grid_x, grid_y)
 
     def handle_key(self, key: int):
         """Handle arrow key presses."""
@@ -309,113 +331,152 @@ class SlidingPuzzle:
 
         if key in move_map:
             dx, dy = move_map[key]
-            new_x = self.empty_pos[0] + dx
-            new_y = self.empty_pos[1] + dy
+            new_x = self.empty_x + dx
+            new_y = self.empty_y + dy
 
             if 0 <= new_x < self.grid_size and 0 <= new_y < self.grid_size:
-                self.swap_tiles((new_x, new_y))
+                self.swap_tiles(new_x, new_y)
 
     def check_win_condition(self) -> bool:
         """Check if the puzzle is solved."""
-        for tile in self.tiles:
-            expected_x = (tile.number - 1) % self.grid_size if tile.number > 0 else self.grid_size - 1
-            expected_y = (tile.number - 1) // self.grid_size if tile.number > 0 else self.grid_size - 1
+        return self.board == self._solved_board
 
-            if tile.grid_pos != [expected_x, expected_y]:
-                return False
-        return True
+    def animate_tiles(self) -> bool:
+        """Smoothly animate all tiles toward their targets. Returns True while any is moving."""
+        target_pixel_x = self.tx * (TILE_SIZE + GRID_MARGIN)
+        target_pixel_y = self.ty * (TILE_SIZE + GRID_MARGIN)
+
+        # Smooth animation in whole-pixel steps, rounded toward zero so both directions
+        # move at the same speed, and never less than one pixel; within a pixel, snap
+        dx = target_pixel_x - self.cpx
+        dy = target_pixel_y - self.cpy
+        step_x = np.sign(dx) * np.maximum(1, np.abs(dx) // ANIMATION_SPEED)
+        step_y = np.sign(dy) * np.maximum(1, np.abs(dy) // ANIMATION_SPEED)
+        self.cpx += np.where(np.abs(dx) > 1, step_x, dx)
+        self.cpy += np.where(np.abs(dy) > 1, step_y, dy)
+
+        # Update grid position for tiles whose animation completed
+        arrived = (self.cpx == target_pixel_x) & (self.cpy == target_pixel_y)
+        self.gx[arrived] = self.tx[arrived]
+        self.gy[arrived] = self.ty[arrived]
+
+        return bool(np.any(self.gx != self.tx) or np.any(self.gy != self.ty))
 
     def update(self):
         """Update game state."""
         # Update tile animations
-        any_animating = False
-        for tile in self.tiles:
-            tile.animate()
-            if tile.is_animating():
-                any_animating = True
-
-        self.animating = any_animating
+        old_x = self.cpx.tolist()
+        old_y = self.cpy.tolist()
+        self.animating = self.animate_tiles()
+
+        # Mark the area each moving tile left and entered, skipping the empty tile
+        new_x = self.cpx.tolist()
+        new_y = self.cpy.tolist()
+        for number in range(1, len(new_x)):
+            if old_x[number] != new_x[number] or old_y[number] != new_y[number]:
+                old_rect = self.tile_screen_rect(old_x[number], old_y[number])
+                self._dirty_rects.append(old_rect.union(self.tile_screen_rect(new_x[number], new_y[number])))
 
         # Check win condition after animations complete
         if not self.animating and not self.game_won and self.moves > 0:
             if self.check_win_condition():
                 self.game_won = True
-
-    def draw(self):
-        """Draw the game."""
-        self.screen.fill(BG_COLOR)
-
-        # Draw title
-        title_surface = TITLE_FONT.render("Sliding Puzzle", True, TEXT_COLOR)
-        title_rect = title_surface.get_rect(centerx=WINDOW_WIDTH // 2, top=20)
-        self.screen.blit(title_surface, title_rect)
-
-        # Draw game info (moves and time)
-        elapsed_time = int(time.time() - self.start_time)
+                self._win_overlay = self.render_win_overlay()
+                self._full_redraw = True
+
+    def tile_screen_rect(self, pixel_x: int, pixel_y: int) -> pygame.Rect:
+        """Get the screen rect of a tile drawn at the given grid pixel position."""
+        return pygame.Rect(self.grid_offset[0] + pixel_x + GRID_MARGIN,
+                           self.grid_offset[1] + pixel_y + GRID_MARGIN,
+                           TILE_SIZE, TILE_SIZE)
+
+    def update_info_surface(self) -> bool:
+        """Re-render the game info line if its text changed. Returns True if it did."""
+        elapsed_time = (pygame.time.get_ticks() - self.start_ticks) // 1000
         minutes = elapsed_time // 60
         seconds = elapsed_time % 60
 
+        # Only re-render the text when the moves or displayed time change
+        info_key = (self.moves, minutes, seconds)
+        if info_key == self._last_info_key:
+            return False
+
         info_text = f"Moves: {self.moves}  |  Time: {minutes:02d}:{seconds:02d}"
-        info_surface = UI_FONT.render(info_text, True, TEXT_COLOR)
-        info_rect = info_surface.get_rect(centerx=WINDOW_WIDTH // 2, top=75)
-        self.screen.blit(info_surface, info_rect)
+        self._info_surface = UI_FONT.render(info_text, True, TEXT_COLOR)
+        self._info_rect = self._info_surface.get_rect(centerx=WINDOW_WIDTH // 2, top=75)
+        self._last_info_key = info_key
+        return True
 
-        # Draw grid background
-        grid_bg_rect = pygame.Rect(
-            self.grid_offset[0] - GRID_MARGIN,
-            self.grid_offset[1] - GRID_MARGIN,
-            TILE_SIZE * self.grid_size + GRID_MARGIN * (self.grid_size + 1),
-            TILE_SIZE * self.grid_size + GRID_MARGIN * (self.grid_size + 1)
-        )
-        pygame.draw.rect(self.screen, GRID_BG_COLOR, grid_bg_rect, border_radius=10)
+    def render_win_overlay(self) -> pygame.Surface:
+        """Render the semi-transparent win screen, with its text, for the just-completed game."""
+        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        overlay.fill(WIN_OVERLAY_COLOR)
+
+        # Win message
+        win_surface = WIN_FONT.render("Solved!", True, (255, 215, 0))  # Gold color
+        win_rect = win_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
+        overlay.blit(win_surface, win_rect)
+
+        # Stats
+        stats_text = f"Completed in {self.moves} moves!"
+        stats_surface = UI_FONT.render(stats_text, True, (255, 255, 255))
+        stats_rect = stats_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
+        overlay.blit(stats_surface, stats_rect)
 
-        # Draw tiles
-        for tile in self.tiles:
-            if tile.number == 0:  # Skip empty tile
-                continue
+        # Prompt to play again
+        prompt_text = "Click 'New Game' to play again"
+        prompt_surface = UI_FONT.render(prompt_text, True, (200, 200, 200))
+        prompt_rect = prompt_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 70))
+        overlay.blit(prompt_surface, prompt_rect)
+
+        return overlay
+
+    def draw(self):
+        """Draw the game, repainting and presenting only the dirty parts of the screen."""
+        # Repaint the info line when the moves or displayed time change
+        if self.update_info_surface():
+            self._dirty_rects.append(self._info_band)
+
+        if self._full_redraw:
+            self.draw_scene()
+            pygame.display.flip()
+        elif self._dirty_rects:
+            for rect in self._dirty_rects:
+                self.screen.set_clip(rect)
+                self.draw_scene()
+            self.screen.set_clip(None)
+            pygame.display.update(self._dirty_rects)
+
+        self._full_redraw = False
+        self._dirty_rects = []
+
+    def draw_scene(self):
+        """Draw the whole scene; blits outside the screen's clip rect are skipped by SDL."""
+        self.screen.fill(BG_COLOR)
 
-            # Calculate screen position
-            screen_x = self.grid_offset[0] + tile.current_pixel_pos[0] + GRID_MARGIN
-            screen_y = self.grid_offset[1] + tile.current_pixel_pos[1] + GRID_MARGIN
+        # Draw title
+        self.screen.blit(self.title_surface, self.title_rect)
 
-            # Draw tile background
-            tile_rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
+        # Draw game info (moves and time)
+        self.screen.blit(self._info_surface, self._info_rect)
 
-            # Draw the image portion for this tile
-            self.screen.blit(self.puzzle_image, tile_rect, tile.image_rect)
+        # Draw grid background
+        self.screen.blit(self._grid_bg, (self.grid_offset[0] - GRID_MARGIN, self.grid_offset[1] - GRID_MARGIN))
 
-            # Draw tile border
-            pygame.draw.rect(self.screen, TILE_BORDER_COLOR, tile_rect, 3, border_radius=5)
+        # Draw tiles, skipping the empty tile at index 0
+        pixel_x = self.cpx.tolist()
+        pixel_y = self.cpy.tolist()
+        for number in range(1, len(pixel_x)):
+            # Draw the pre-rendered tile (image portion and border)
+            tile_rect = self.tile_screen_rect(pixel_x[number], pixel_y[number])
+            self.screen.blit(self.tile_surfaces[number], tile_rect)
 
         # Draw reset button
         self.reset_button.draw(self.screen)
 
         # Draw win overlay
         if self.game_won:
-            # Semi-transparent overlay
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            overlay.fill(WIN_OVERLAY_COLOR)
-            self.screen.blit(overlay, (0, 0))
-
-            # Win message
-            win_text = "Solved!"
-            win_surface = WIN_FONT.render(win_text, True, (255, 215, 0))  # Gold color
-            win_rect = win_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
-            self.screen.blit(win_surface, win_rect)
-
-            # Stats
-            stats_text = f"Completed in {self.moves} moves!"
-            stats_surface = UI_FONT.render(stats_text, True, (255, 255, 255))
-            stats_rect = stats_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
-            self.screen.blit(stats_surface, stats_rect)
-
-            # Prompt to play again
-            prompt_text = "Click 'New Game' to play again"
-            prompt_surface = UI_FONT.render(prompt_text, True, (200, 200, 200))
-            prompt_rect = prompt_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 70))
-            self.screen.blit(prompt_surface, prompt_rect)
-
-        pygame.display.flip()
+            self.screen.blit(self._win_overlay, (0, 0))
 
     def run(self):
         """Main game loop."""
@@ -431,11 +492,24 @@ class SlidingPuzzle:
                     self.handle_key(event.key)
 
                 # Handle button events
+                was_hovered = self.reset_button.is_hovered
                 if self.reset_button.handle_event(event):
                     self.init_puzzle()
 
-            # Update and draw
-            self.update()
+                # Mouse motion only matters when it changes the button's hover state;
+                # input that moves tiles is covered by the animation below, and any
+                # other event (window exposed, focus change, ...) repaints everything
+                if event.type == pygame.MOUSEMOTION:
+                    if self.reset_button.is_hovered != was_hovered:
+                        self._dirty_rects.append(self.reset_button.rect.copy())
+                elif event.type not in _INPUT_EVENTS:
+                    self._full_redraw = True
+
+            # Update only while tiles are moving; when idle the game state cannot change
+            if self.animating:
+                self.update()
+
+            # Draw only what changed; this is a no-op when idle
             self.draw()
 
             # Cap frame rate
@@ -69,16 +69,54 @@ def test_puzzle_logic():
     target_pos = [200, 200]
     animation_speed = 15
 
-    # Simulate one animation frame
-    dx = target_pos[0] - current_pos[0]
-    dy = target_pos[1] - current_pos[1]
-    new_x = current_pos[0] + dx / animation_speed
-    new_y = current_pos[1] + dy / animation_speed
+    # One animation frame: a whole-pixel step rounded toward zero, at least 1 px
+    def step(pos, target):
+        remaining = target - pos
+        if abs(remaining) <= 1:
+            return target
+        move = max(1, abs(remaining) // animation_speed)
+        return pos + move if remaining > 0 else pos - move
+
+    new_x = step(current_pos[0], target_pos[0])
+    new_y = step(current_pos[1], target_pos[1])
 
     print(f"  Current: {current_pos}, Target: {target_pos}")
-    print(f"  After one frame: [{new_x:.1f}, {new_y:.1f}]")
+    print(f"  After one frame: [{new_x}, {new_y}]")
+
+    # Simulate a one-cell move (130 px) in both directions until the tile settles
+    def frames_to_settle(start, target):
+        pos, frames = start, 0
+        while pos != target:
+            pos = step(pos, target)
+            frames += 1
+        return frames
+
+    forward = frames_to_settle(0, 130)
+    backward = frames_to_settle(130, 0)
+    print(f"  One-cell move settles after {forward} frames forward, {backward} backward")
+    assert forward == backward, "Tiles should animate at the same speed in both directions"
     print("  ✓ Smooth animation interpolation works\n")
 
+    # Test 6: Byte board win check
+    print("Test 6: Board state")
+    num_cells = grid_size * grid_size
+    solved_board = bytes((i + 1) % num_cells for i in range(num_cells))
+    board = bytearray(solved_board)
+    empty_idx = num_cells - 1
+
+    # Slide tile 15 (cell 14) into the empty corner (cell 15), then back
+    def slide(board, empty_idx, idx):
+        board[empty_idx], board[idx] = board[idx], 0
+        return idx
+
+    empty_idx = slide(board, empty_idx, 14)
+    print(f"  Solved: {list(solved_board)}")
+    print(f"  After one move: {list(board)}")
+    assert board != solved_board, "Moved puzzle should not match solved board"
+    empty_idx = slide(board, empty_idx, 15)
+    assert board == solved_board and empty_idx == 15, "Undoing the move should restore it"
+    print("  ✓ Board tracks moves correctly\n")
+
     print("="*50)
     print("All core game logic tests passed! ✓")
     print("="*50)